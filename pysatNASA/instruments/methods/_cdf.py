@@ -9,7 +9,6 @@
 # ----------------------------------------------------------------------------
 """Provides CDF class to parse cdaweb CDF files."""
 
-import datetime as dt
 import numpy as np
 import pandas as pds
 import re
@@ -239,16 +238,20 @@ class CDF(object):
                         new_xdata = []
 
                     # Add delta to time, if both plus and minus are defined
-                    if np.all(has_plus_minus):
+                    # and the epoch was successfully converted
+                    if np.all(has_plus_minus) and len(new_xdata) > 0:
                         # This defines delta_time in seconds supplied
                         delta_time = np.asarray((delta_plus_var
                                                  - delta_minus_var) / 2.0)
 
                         # delta_time may be a single value or an array
-                        xdata = [xx + dt.timedelta(seconds=int(delta_time))
-                                 if delta_time.shape == ()
-                                 else xx + dt.timedelta(seconds=delta_time[i])
-                                 for i, xx in enumerate(new_xdata)]
+                        if delta_time.shape == ():
+                            delta_time = np.timedelta64(int(delta_time), 's')
+                        else:
+                            delta_time = np.round(delta_time * 1.0e6).astype(
+                                'timedelta64[us]')
+                        xdata = np.asarray(new_xdata,
+                                           dtype='datetime64[ns]') + delta_time
                     else:
                         xdata = new_xdata
 
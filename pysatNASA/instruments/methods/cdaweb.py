@@ -51,6 +51,9 @@ except ImportError:
     # Use cdflib as default for pandas data sets
     auto_CDF = libCDF
 
+# Size of the blocks written to disk when streaming downloaded files
+_chunk_size = 1024 * 1024
+
 
 def try_inst_dict(inst_id, tag, supported_tags):
     """Check that the inst_id and tag combination is valid.
@@ -575,14 +578,14 @@ def download(date_array, data_path, tag='', inst_id='', supported_tags=None,
         logger.info(' '.join(('Attempting to download file for',
                               date.strftime('%d %B %Y'))))
         try:
-            with requests.get(remote_path) as req:
+            with requests.get(remote_path, stream=True) as req:
                 if req.status_code != 404:
                     if zip_method:
-                        _get_file(req.content, data_path, fname,
+                        _get_file(req, data_path, fname,
                                   temp_path=temp_dir.name,
                                   zip_method=zip_method)
                     else:
-                        _get_file(req.content, data_path, fname)
+                        _get_file(req, data_path, fname)
                     logger.info(''.join(('Successfully downloaded ',
                                          fname, '.')))
                 else:
@@ -606,8 +609,9 @@ def _get_file(remote_file, data_path, fname, temp_path=None, zip_method=None):
 
     Parameters
     ----------
-    remote_file : file content
-        File content retireved via requests.
+    remote_file : file content or requests.Response
+        File content retireved via requests. If a streamed response is
+        provided, the content is written to disk in chunks.
     data_path : str
         Path to pysat archival directory.
     fname : str
@@ -635,9 +639,23 @@ def _get_file(remote_file, data_path, fname, temp_path=None, zip_method=None):
         # Use the pysat data directory.
         dl_fname = os.path.join(data_path, fname)
 
-    # Download the file to desired destination.
-    with open(dl_fname, 'wb') as open_f:
-        open_f.write(remote_file)
+    # Download the file to desired destination.  Streamed content is written
+    # to a partial file first, so that an interrupted download does not leave
+    # a truncated file under the final name.
+    if hasattr(remote_file, 'iter_content'):
+        part_fname = '.'.join((dl_fname, 'part'))
+        try:
+            with open(part_fname, 'wb') as open_f:
+                for chunk in remote_file.iter_content(chunk_size=_chunk_size):
+                    open_f.write(chunk)
+        except Exception:
+            if os.path.isfile(part_fname):
+                os.remove(part_fname)
+            raise
+        os.replace(part_fname, dl_fname)
+    else:
+        with open(dl_fname, 'wb') as open_f:
+            open_f.write(remote_file)
 
     # Unzip and move the files from the temporary directory.
     if zip_method == 'zip':
@@ -729,10 +747,9 @@ def cdas_download(date_array, data_path, tag='', inst_id='',
         logger.info(' '.join(('Attempting to download file: ',
                               file)))
         try:
-            with requests.get(file) as req:
+            with requests.get(file, stream=True) as req:
                 if req.status_code != 404:
-                    with open(saved_local_fname, 'wb') as open_f:
-                        open_f.write(req.content)
+                    _get_file(req, data_path, fname)
                     logger.info('Successfully downloaded {:}.'.format(
                         saved_local_fname))
                 else:
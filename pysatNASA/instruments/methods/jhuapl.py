@@ -18,9 +18,16 @@ import pysat
 from pysat.utils.coords import expand_xarray_dims
 from pysat.utils.io import load_netcdf
 
+# Metadata labels used when loading the NetCDF files
+_load_labels = {'units': ('UNITS', str), 'desc': ('TITLE', str)}
+
+# Channel labels for the SDR imaging and spectrograph 'nchan' coordinates
+_sdr_nchan = ["121.6nm", "130.4nm", "135.6nm", "LBHshort", "LBHlong"]
+_sdr_spect_nchan = _sdr_nchan + ["?"]
+
 
 def build_dtimes(data, var, epoch=None, epoch_var='time'):
-    """Build datetime objects from standard JHU APL time variables.
+    """Build a datetime64 array from standard JHU APL time variables.
 
     Parameters
     ----------
@@ -37,43 +44,32 @@ def build_dtimes(data, var, epoch=None, epoch_var='time'):
 
     Returns
     -------
-    dtimes : list-like
-        List of datetime objects
+    dtimes : np.ndarray
+        Array of np.datetime64 values
 
     """
     ykey = 'YEAR{:s}'.format(var)
     dkey = 'DOY{:s}'.format(var)
     skey = 'TIME{:s}'.format(var)
 
+    # Get the start of each day of year.  Seconds of day beyond 86400 roll
+    # over into the next day when the time offsets are added.
+    years = data[ykey].values.astype(np.int64) - 1970
+    days = data[dkey].values.astype(np.int64) - 1
+    dtimes = (years.astype('datetime64[Y]').astype('datetime64[ns]')
+              + days.astype('timedelta64[D]'))
+
     if epoch is None:
-        hours = np.array([int(np.floor(sec / 3600.0))
-                          for sec in data[skey].values])
-        mins = [int(np.floor((sec - hours[i] * 3600) / 60.0))
-                for i, sec in enumerate(data[skey].values)]
-        secs = [int(np.floor((sec - hours[i] * 3600 - mins[i] * 60)))
-                for i, sec in enumerate(data[skey].values)]
-        microsecs = [int(np.floor((sec - hours[i] * 3600 - mins[i] * 60
-                                   - secs[i]) * 1.0e6))
-                     for i, sec in enumerate(data[skey].values)]
-        days = np.array([int(dval) for dval in data[dkey].values])
-
-        # Ensure hours are within a realistic range. Datetime can handle day of
-        # roll-over for non-leap years.
-        days[hours >= 24] += 1
-        hours[hours >= 24] -= 24
-
-        dtimes = [
-            dt.datetime.strptime(
-                "{:4d}-{:03d}-{:02d}-{:02d}-{:02d}-{:06d}".format(
-                    int(data[ykey].values[i]), days[i], hours[i], mins[i],
-                    secs[i], microsec), '%Y-%j-%H-%M-%S-%f')
-            for i, microsec in enumerate(microsecs)]
+        # Split the seconds of day into whole seconds and microseconds
+        sods = data[skey].values.astype(np.float64)
+        secs = np.floor(sods)
+        microsecs = np.floor((sods - secs) * 1.0e6)
+
+        dtimes = (dtimes + secs.astype(np.int64).astype('timedelta64[s]')
+                  + microsecs.astype(np.int64).astype('timedelta64[us]'))
     else:
-        dtimes = [
-            dt.datetime.strptime("{:4d}-{:03d}".format(
-                int(data[ykey].values[i]), int(data[dkey].values[i])), '%Y-%j')
-            + (pds.to_datetime(etime).to_pydatetime() - epoch)
-            for i, etime in enumerate(data[epoch_var].values)]
+        dtimes = dtimes + (data[epoch_var].values.astype('datetime64[ns]')
+                           - np.datetime64(epoch, 'ns'))
 
     return dtimes
 
@@ -122,10 +118,6 @@ def load_edr_aurora(fnames, tag='', inst_id='', pandas_format=False,
     mdata = pysat.Meta()
     data = xr.Dataset()
 
-    # Define the input variables
-    labels = {mdata.labels.units: ('UNITS', str),
-              mdata.labels.desc: ('TITLE', str)}
-
     # CDAWeb stores these files in the NetCDF format instead of the CDF format
     single_data = list()
     for fname in fnames:
@@ -133,7 +125,7 @@ def load_edr_aurora(fnames, tag='', inst_id='', pandas_format=False,
         # than a dimension or coordinate.  Additionally, no coordinates
         # are assigned.
         sdata, mdata = load_netcdf(fname, epoch_name='TIME', epoch_unit='s',
-                                   meta_kwargs={'labels': labels},
+                                   meta_kwargs={'labels': _load_labels},
                                    pandas_format=pandas_format,
                                    decode_times=False,
                                    strict_dim_check=strict_dim_check)
@@ -216,9 +208,7 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
     mdata = pysat.Meta()
     data = xr.Dataset()
 
-    # Define the input variables and working variables
-    labels = {mdata.labels.units: ('UNITS', str),
-              mdata.labels.desc: ('TITLE', str)}
+    # Define the working variables
     load_time = 'TIME_DAY'
     time_vars = ['YEAR_DAY', 'DOY_DAY', 'TIME_EPOCH_DAY', 'YEAR_NIGHT',
                  'DOY_NIGHT', 'TIME_NIGHT', 'TIME_EPOCH_NIGHT']
@@ -227,14 +217,21 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
               'PIERCEPOINT_DAY_LATITUDE', 'PIERCEPOINT_DAY_LONGITUDE',
               'PIERCEPOINT_DAY_ALTITUDE', 'PIERCEPOINT_DAY_SZA']
     time_dims = ['time']
-    if name == 'guvi':
+
+    # Determine the data product type once, as it is used within the file loop
+    is_guvi = name == 'guvi'
+    is_imaging = tag in ['sdr-imaging', 'sdr-disk', 'sdr2-disk']
+    is_spect = tag == 'sdr-spectrograph'
+    is_low_spect = is_spect and inst_id == 'low_res'
+
+    if is_guvi:
         rename_dims = {'nAlongDay': 'nAlong', 'nAlongNight': 'nAlong'}
         swap_dims = {'nAlong': 'time'}
     else:
         rename_dims = {}
         swap_dims = {'nAlongDay': 'time'}
 
-    if tag in ['sdr-imaging', 'sdr-disk', 'sdr2-disk']:
+    if is_imaging:
         time_vars.extend(["YEAR_DAY_AURORAL", "DOY_DAY_AURORAL",
                           "TIME_DAY_AURORAL", "TIME_EPOCH_DAY_AURORAL"])
         coords.extend(['PIERCEPOINT_DAY_LATITUDE_AURORAL',
@@ -243,19 +240,19 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
                        'PIERCEPOINT_DAY_SZA_AURORAL'])
         time_dims.append('time_auroral')
         rename_dims['nAlongDayAur'] = 'time_auroral'
-        if name == 'guvi':
+        if is_guvi:
             rename_dims['nCrossDay'] = 'nCross'
             rename_dims['nCrossNight'] = 'nCross'
         else:
             time_dims.append('time_night')
             rename_dims['nAlongNight'] = 'time_night'
-    elif tag == 'sdr-spectrograph':
+    elif is_spect:
         coords.extend(['PIERCEPOINT_NIGHT_ZENITH_ANGLE',
                        'PIERCEPOINT_NIGHT_SAZIMUTH',
                        'PIERCEPOINT_DAY_ZENITH_ANGLE',
                        'PIERCEPOINT_DAY_SAZIMUTH'])
 
-        if inst_id == 'low_res':
+        if is_low_spect:
             time_vars.extend(["YEAR_GAIM_DAY", "DOY_GAIM_DAY", "TIME_GAIM_DAY",
                               "TIME_GAIM_NIGHT", "YEAR_GAIM_NIGHT",
                               "DOY_GAIM_NIGHT"])
@@ -264,13 +261,13 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
             rename_dims['nAlongGAIMNight'] = 'time_gaim_night'
 
     # CDAWeb stores these files in the NetCDF format instead of the CDF format
-    inners = None
+    file_inners = {dim: list() for dim in time_dims}
     for fname in fnames:
         # There are multiple files per day, with time as a variable rather
         # than a dimension or coordinate.  Additionally, no coordinates
         # are assigned.
         sdata, mdata = load_netcdf(fname, epoch_name=load_time, epoch_unit='s',
-                                   meta_kwargs={'labels': labels},
+                                   meta_kwargs={'labels': _load_labels},
                                    pandas_format=pandas_format,
                                    decode_times=False,
                                    strict_dim_check=strict_dim_check)
@@ -281,7 +278,7 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
         ftime = build_dtimes(sdata, '_DAY', dt.datetime(1970, 1, 1))
 
         # Ensure identical day and night dimensions for GUVI
-        if name == 'guvi':
+        if is_guvi:
             if sdata.sizes['nAlongDay'] != sdata.sizes['nAlongNight']:
                 raise ValueError('Along-track day and night dimensions differ')
 
@@ -295,23 +292,24 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
         # Combine identical dimensions and rename some time dimensions
         sdata = sdata.rename_dims(rename_dims)
 
-        if tag in ['sdr-imaging', 'sdr-disk', 'sdr2-disk']:
+        if is_imaging:
             sdata = sdata.assign(time_auroral=build_dtimes(sdata,
                                                            '_DAY_AURORAL'))
-        elif tag == 'sdr-spectrograph' and inst_id == 'low_res':
+        elif is_low_spect:
             sdata = sdata.assign(time_gaim_day=build_dtimes(
                 sdata, '_GAIM_DAY'), time_gaim_night=build_dtimes(
                     sdata, '_GAIM_NIGHT'))
 
         # Test that day and night times are consistent
-        if name == 'guvi':
+        if is_guvi:
             max_diff = 1.0
-            for i, ntime in enumerate(build_dtimes(sdata, '_NIGHT')):
-                diff_sec = abs(ntime - ftime[i]).total_seconds()
-                if diff_sec > max_diff:
-                    raise ValueError(''.join(['Day and night times differ by ',
-                                              '{:.3f} s >= {:.3f} s'.format(
-                                                  diff_sec, max_diff)]))
+            diff_ns = np.abs(build_dtimes(sdata, '_NIGHT').view(np.int64)
+                             - ftime.view(np.int64))
+            if np.any(diff_ns > max_diff * 1.0e9):
+                raise ValueError(''.join(['Day and night times differ by ',
+                                          '{:.3f} s >= {:.3f} s'.format(
+                                              diff_ns.max() * 1.0e-9,
+                                              max_diff)]))
 
         # Remove redundant time variables and rname the 'nAlong' dimension
         sdata = sdata.drop_vars(time_vars).swap_dims(swap_dims)
@@ -319,25 +317,27 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
         # Assign time as a coordinate for combining files indexing
         sdata['time'] = ftime
 
-        # Separate into inner datasets
-        inner_keys = {dim: [key for key in sdata.keys()
-                            if dim in sdata[key].dims] for dim in time_dims}
-        inner_dat = {dim: sdata.get(inner_keys[dim]) for dim in time_dims}
+        # Separate into inner datasets, using a single pass over the variables
+        # that also identifies the 'single_var' variables
+        inner_keys = {dim: list() for dim in time_dims}
+        sv_keys = list()
+        for key in sdata.data_vars.keys():
+            var_dims = sdata.variables[key].dims
+            for dim in time_dims:
+                if dim in var_dims:
+                    inner_keys[dim].append(key)
+            if 'single_var' in var_dims:
+                sv_keys.append(key)
+        inner_dat = {dim: sdata[inner_keys[dim]] for dim in time_dims}
 
         # Add 'single_var's into 'time' dataset to keep track
-        sv_keys = [val.name for val in sdata.values()
-                   if 'single_var' in val.dims]
-        singlevar_set = sdata.get(sv_keys)
-        inner_dat['time'] = xr.merge([inner_dat['time'], singlevar_set])
-
-        # Concatenate along desired dimension with previous files' data
-        if inners is None:
-            # No previous data, assign the data separated by dimension
-            inners = dict(inner_dat)
-        else:
-            # Concatenate with existing data
-            inners = {dim: xr.concat([inners[dim], inner_dat[dim]], dim=dim)
-                      for dim in time_dims}
+        if len(sv_keys) > 0:
+            inner_dat['time'] = xr.merge([inner_dat['time'], sdata[sv_keys]])
+
+        # Save the data separated by dimension, concatenating once all files
+        # have been loaded
+        for dim in time_dims:
+            file_inners[dim].append(inner_dat[dim])
 
     # Update the meta data
     # TODO(https://github.com/pysat/pysat/issues/1078): Update the metadata by
@@ -350,6 +350,13 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
     mdata['time_auroral'] = {'desc': 'Auroral time index'}
     mdata['nCross'] = {'desc': 'Number of cross-track observations'}
 
+    # Concatenate the data from all files along each time dimension
+    inners = None
+    if len(file_inners['time']) > 0:
+        inners = {dim: file_inners[dim][0] if len(file_inners[dim]) == 1
+                  else xr.concat(file_inners[dim], dim=dim)
+                  for dim in time_dims}
+
     # Combine all time dimensions
     if inners is not None:
         if combine_times:
@@ -383,14 +390,11 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
                                           'missing from data: {:}'.format(
                                               bad_coords)]))
 
-        # Set additional coordinates
-        data = data.set_coords(coords).assign_coords({'time': data['time']})
-        if tag in ['sdr-imaging', 'sdr-disk', 'sdr2-disk']:
+        # Set additional coordinates, 'time' is already a coordinate
+        data = data.set_coords(coords)
+        if is_imaging:
             # Get the additional coordinates to assign
-            add_coords = {'nchan': ["121.6nm", "130.4nm", "135.6nm", "LBHshort",
-                                    "LBHlong"],
-                          "nchanAur": ["121.6nm", "130.4nm", "135.6nm",
-                                       "LBHshort", "LBHlong"]}
+            add_coords = {'nchan': _sdr_nchan, "nchanAur": _sdr_nchan}
             for dvar in sdata.data_vars.keys():
                 if dvar.find('nCross') == 0:
                     # Identify all cross-track variables
@@ -398,13 +402,12 @@ def load_sdr_aurora(fnames, name='', tag='', inst_id='', pandas_format=False,
 
             # Assign the additional coordinates
             data = data.assign_coords(add_coords)
-        elif tag == 'sdr-spectrograph':
-            data = data.assign_coords({"nchan": ["121.6nm", "130.4nm",
-                                                 "135.6nm", "LBHshort",
-                                                 "LBHlong", "?"]})
+        elif is_spect:
+            data = data.assign_coords({"nchan": _sdr_spect_nchan})
 
-        # Ensure the data is ordered correctly
-        data = data.sortby('time')
+        # Ensure the data is ordered correctly, only sorting when needed
+        if not data.indexes['time'].is_monotonic_increasing:
+            data = data.sortby('time')
 
     return data, mdata
 
@@ -425,40 +428,48 @@ def clean_by_dqi(inst):
         3: LBH Thresh exceeded (allowed at none)
 
     """
+    # Determine the largest DQI value allowed at this clean level
+    if inst.clean_level == 'clean':
+        # For clean, require DQI of zero (MeV noise only)
+        max_dqi = 0
+    elif inst.clean_level in ['dusty', 'dirty']:
+        # For dusty and dirty, allow the SAA region as well
+        max_dqi = 1
+    else:
+        # For none, allow all to pass
+        return
+
     # Find the flag variables
-    dqi_vars = [var for var in inst.variables if var.find('DQI') == 0]
+    dqi_vars = [var for var in inst.variables if var.startswith('DQI')]
+
+    # Get the variables that may be cleaned, excluding coordinates, flags, and
+    # SAA indicators
+    skip_vars = set(inst.data.coords.keys()).union(dqi_vars)
+    clean_vars = [var for var in inst.variables
+                  if var not in skip_vars and "IN_SAA" not in var]
 
     # Find the variables affected by each flag
     dat_vars = dict()
     for dqi in dqi_vars:
         dqi_dims = inst.data[dqi].dims
-        dat_vars[dqi] = [var for var in inst.variables
-                         if dqi_dims == inst.data[var].dims[:len(dqi_dims)]
-                         and var not in inst.data.coords.keys()
-                         and var.find("IN_SAA") < 0 and var not in dqi_vars]
+        dat_vars[dqi] = [var for var in clean_vars
+                         if dqi_dims == inst.data[var].dims[:len(dqi_dims)]]
 
+    fill_label = inst.meta.labels.fill_val
     for dqi in dqi_vars:
-        if inst.clean_level == 'clean':
-            # For clean, require DQI of zero (MeV noise only)
-            dqi_bad = inst.data[dqi].values > 0
-        elif inst.clean_level in ['dusty', 'dirty']:
-            # For dusty and dirty, allow the SAA region as well
-            dqi_bad = inst.data[dqi].values > 1
-        else:
-            # For none, allow all to pass
-            dqi_bad = np.full(inst.data[dqi].values.shape, False)
+        dqi_bad = inst.data[dqi].values > max_dqi
 
         # Apply the DQI mask to the data, replacing bad values with
         # appropriate fill values if there are bad values
         if dqi_bad.any():
             for dat_var in dat_vars[dqi]:
-                fill_val = inst.meta[dat_var, inst.meta.labels.fill_val]
+                fill_val = inst.meta[dat_var, fill_label]
                 try:
                     inst.data[dat_var].values[dqi_bad] = fill_val
                 except ValueError:
                     # Try again with NaN, a bad fill value was set
                     inst.data[dat_var].values[dqi_bad] = np.nan
-                    inst.meta[dat_var] = {inst.meta.labels.fill_val: np.nan}
+                    inst.meta[dat_var] = {fill_label: np.nan}
     return
 
 
@@ -493,31 +504,42 @@ def concat_data(inst, time_dims, new_data, combine_times=False, **kwargs):
         new_data = pysat.utils.coords.expand_xarray_dims(
             new_data, inst.meta, exclude_dims=time_dims)
 
-        # Combine the data
-        inst.data = xr.combine_by_coords(new_data, **kwargs)
+        # Combine the data, which is provided in time order
+        inst.data = xr.combine_nested(new_data, concat_dim=time_dims[0],
+                                      **kwargs)
     else:
-        inners = None
+        ndata_inners = {dim: list() for dim in time_dims}
         for ndata in new_data:
-            # Separate into inner datasets
-            inner_keys = {dim: [key for key in ndata.keys()
-                                if dim in ndata[key].dims] for dim in time_dims}
-            inner_dat = {dim: ndata.get(inner_keys[dim]) for dim in time_dims}
+            # Separate into inner datasets, using a single pass over the
+            # variables that also identifies the 'single_var' variables
+            inner_keys = {dim: list() for dim in time_dims}
+            sv_keys = list()
+            for key in ndata.data_vars.keys():
+                var_dims = ndata.variables[key].dims
+                for dim in time_dims:
+                    if dim in var_dims:
+                        inner_keys[dim].append(key)
+                if 'single_var' in var_dims:
+                    sv_keys.append(key)
+            inner_dat = {dim: ndata[inner_keys[dim]] for dim in time_dims}
 
             # Add 'single_var's into 'time' dataset to keep track
-            sv_keys = [val.name for val in ndata.values()
-                       if 'single_var' in val.dims]
-            singlevar_set = ndata.get(sv_keys)
-            inner_dat[inst.index.name] = xr.merge([inner_dat[inst.index.name],
-                                                   singlevar_set])
-
-            # Concatenate along desired dimension with previous data
-            if inners is None:
-                # No previous data, assign the data separated by dimension
-                inners = dict(inner_dat)
-            else:
-                # Concatenate with existing data
-                inners = {dim: xr.concat([inners[dim], inner_dat[dim]],
-                                         dim=dim) for dim in time_dims}
+            if len(sv_keys) > 0:
+                inner_dat[inst.index.name] = xr.merge(
+                    [inner_dat[inst.index.name], ndata[sv_keys]])
+
+            # Save the data separated by dimension, concatenating once all
+            # data objects have been separated
+            for dim in time_dims:
+                ndata_inners[dim].append(inner_dat[dim])
+
+        # Concatenate the data along each time dimension
+        inners = None
+        if len(ndata_inners[inst.index.name]) > 0:
+            inners = {dim: ndata_inners[dim][0]
+                      if len(ndata_inners[dim]) == 1
+                      else xr.concat(ndata_inners[dim], dim=dim)
+                      for dim in time_dims}
 
         # Combine all time dimensions
         if inners is not None:
@@ -52,6 +52,7 @@ Examples
 import datetime as dt
 import functools
 import numpy as np
+import pandas as pds
 
 from pysat.instruments.methods import general as ps_gen
 from pysat.utils.io import load_netcdf
@@ -81,6 +82,27 @@ _clean_warn = {inst_id: {tag: mm_nasa.clean_warnings
                          for tag in inst_ids[inst_id]}
                for inst_id in inst_ids.keys()}
 
+# ----------------------------------------------------------------------------
+# Instrument load attributes
+
+_load_labels = {'units': ('Units', str), 'name': ('Long_Name', str),
+                'notes': ('Var_Notes', str), 'desc': ('CatDesc', str),
+                'plot': ('plot', str), 'axis': ('axis', str),
+                'scale': ('scale', str),
+                'min_val': ('Valid_Min', np.float64),
+                'max_val': ('Valid_Max', np.float64),
+                'fill_val': ('fill', np.float64)}
+
+# Generate custom meta translation table. When left unspecified the default
+# table handles the multiple values for fill. We must recreate that
+# functionality in our table. The targets for meta_translation should
+# map to values in `_load_labels` above.
+_meta_translation = {'FIELDNAM': 'plot', 'LABLAXIS': 'axis',
+                     'ScaleTyp': 'scale', 'VALIDMIN': 'Valid_Min',
+                     'Valid_Min': 'Valid_Min', 'VALIDMAX': 'Valid_Max',
+                     'Valid_Max': 'Valid_Max', '_FillValue': 'fill',
+                     'FillVal': 'fill', 'TIME_BASE': 'time_base'}
+
 # ----------------------------------------------------------------------------
 # Instrument methods
 
@@ -231,24 +253,6 @@ def load(fnames, tag='', inst_id=''):
 
     """
 
-    labels = {'units': ('Units', str), 'name': ('Long_Name', str),
-              'notes': ('Var_Notes', str), 'desc': ('CatDesc', str),
-              'plot': ('plot', str), 'axis': ('axis', str),
-              'scale': ('scale', str),
-              'min_val': ('Valid_Min', np.float64),
-              'max_val': ('Valid_Max', np.float64),
-              'fill_val': ('fill', np.float64)}
-
-    # Generate custom meta translation table. When left unspecified the default
-    # table handles the multiple values for fill. We must recreate that
-    # functionality in our table. The targets for meta_translation should
-    # map to values in `labels` above.
-    meta_translation = {'FIELDNAM': 'plot', 'LABLAXIS': 'axis',
-                        'ScaleTyp': 'scale', 'VALIDMIN': 'Valid_Min',
-                        'Valid_Min': 'Valid_Min', 'VALIDMAX': 'Valid_Max',
-                        'Valid_Max': 'Valid_Max', '_FillValue': 'fill',
-                        'FillVal': 'fill', 'TIME_BASE': 'time_base'}
-
     if tag in ['nmax', 'tdisk', 'tlimb']:
         epoch_name = 'nscans'
 
@@ -257,31 +261,33 @@ def load(fnames, tag='', inst_id=''):
 
     data, meta = load_netcdf(fnames, pandas_format=pandas_format,
                              epoch_name=epoch_name,
-                             meta_kwargs={'labels': labels},
-                             meta_translation=meta_translation,
+                             meta_kwargs={'labels': _load_labels},
+                             meta_translation=_meta_translation,
                              combine_by_coords=False,
                              drop_meta_labels='FILLVAL',
                              decode_times=False)
 
     if tag in ['nmax', 'tdisk', 'tlimb']:
-        # Add time coordinate from scan_start_time
-        time = [dt.datetime.strptime(str(val), "b'%Y-%m-%dT%H:%M:%SZ'")
-                for val in data['scan_start_time'].values]
+        # Add time coordinate from scan_start_time, which is stored as
+        # byte strings.  Pandas parses the fixed format in compiled code.
+        time = np.char.decode(data['scan_start_time'].values.astype(bytes),
+                              'ascii')
+        time = pds.to_datetime(time, format='%Y-%m-%dT%H:%M:%SZ').values
 
         # Add a delta of 1 microsecond for channel B.
-        delta_time = [1 if ch == b'CHB' else 0 for ch in data['channel'].values]
-        data['time'] = [time[i] + dt.timedelta(microseconds=delta_time[i])
-                        for i in range(0, len(time))]
+        delta_time = np.where(data['channel'].values == b'CHB',
+                              np.timedelta64(1, 'us'), np.timedelta64(0, 'us'))
+        data['time'] = time + delta_time
 
-        # Sort times to ensure monotonic increase.
-        data = data.sortby('time')
+        # Sort times to ensure monotonic increase.  Files are nearly always
+        # ordered already, so only reindex the data when needed.
+        if not data.indexes['time'].is_monotonic_increasing:
+            data = data.isel(time=np.argsort(data['time'].values,
+                                             kind='stable'))
 
         # Update coordinates with dimensional data
-        data = data.assign_coords({'nlats': data['nlats'],
-                                   'nlons': data['nlons'],
-                                   'nmask': data['nmask'],
-                                   'channel': data['channel'],
-                                   'hemisphere': data['hemisphere']})
+        data = _update_coords(data, ['nlats', 'nlons', 'nmask'],
+                              ['channel', 'hemisphere'])
         meta['time'] = {meta.labels.notes: 'Converted from scan_start_time'}
         meta['nlats'] = {meta.labels.notes: 'Index for latitude values'}
         meta['nlons'] = {meta.labels.notes: 'Index for longitude values'}
@@ -295,18 +301,16 @@ def load(fnames, tag='', inst_id=''):
             data['zdat'] = data['zdat'].isel(time=0)
 
         # Add time coordinate from utc_time
-        data['time'] = [dt.datetime.strptime(str(val),
-                        "b'%Y-%m-%dT%H:%M:%S.%fZ'")
-                        for val in data['time_utc'].values]
+        time = np.char.decode(data['time_utc'].values.astype(bytes), 'ascii')
+        data['time'] = pds.to_datetime(time,
+                                       format='%Y-%m-%dT%H:%M:%S.%fZ').values
 
         # Add retrieval altitude values and data tangent altitude values
         data = data.swap_dims({"nzret": "zret", "nzdat": "zdat"})
 
         # Update coordinates with dimensional data
-        data = data.assign_coords({'zret': data['zret'],
-                                   'zdat': data['zdat'],
-                                   'n_wavelength': data['n_wavelength'],
-                                   'channel': data['channel']})
+        data = _update_coords(data, ['n_wavelength'],
+                              ['zret', 'zdat', 'channel'])
         meta['time'] = {meta.labels.notes: 'Converted from time_utc'}
         meta['zret'] = {meta.labels.notes: ''.join(('Index for retrieval',
                                                     ' altitude values'))}
@@ -314,3 +318,30 @@ def load(fnames, tag='', inst_id=''):
                                                     ' altitude values'))}
 
     return data, meta
+
+
+def _update_coords(data, index_dims, coord_vars):
+    """Update the coordinates of loaded GOLD data.
+
+    Parameters
+    ----------
+    data : xr.Dataset
+        GOLD data with the time dimension already assigned
+    index_dims : list
+        Dimensions without a data variable, which are given their default
+        integer index as a coordinate
+    coord_vars : list
+        Data variables that should be set as coordinates
+
+    Returns
+    -------
+    data : xr.Dataset
+        GOLD data with updated coordinates
+
+    """
+    # Index-only dimensions have no variable to set as a coordinate, but do
+    # return a default integer index that may be assigned
+    data = data.assign_coords({dim: data[dim] for dim in index_dims})
+    data = data.set_coords(coord_vars)
+
+    return data
@@ -95,7 +95,7 @@ class TestInstruments(clslib.InstLibTests):
                 test_inst.load(date=date, use_cdflib=True)
             except ValueError as verr:
                 # Check if instrument is failing due to strict time flag
-                if str(verr).find('Loaded data') > 0:
+                if 'Loaded data' in str(verr):
                     test_inst.strict_time_flag = False
                     with warnings.catch_warnings(record=True) as war:
                         test_inst.load(date=date)
@@ -131,7 +131,7 @@ class TestInstruments(clslib.InstLibTests):
             test_inst.load(date=date, use_header=True, use_cdflib=True)
         except ValueError as verr:
             # Check if instrument is failing due to strict time flag
-            if str(verr).find('Loaded data') > 0:
+            if 'Loaded data' in str(verr):
                 test_inst.strict_time_flag = False
                 with warnings.catch_warnings(record=True) as war:
                     test_inst.load(date=date, use_header=True, use_cdflib=True)
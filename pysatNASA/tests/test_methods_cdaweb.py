@@ -23,6 +23,35 @@ import pysatNASA
 from pysatNASA.instruments.methods import cdaweb as cdw
 
 
+class StreamedResponse(object):
+    """Stand-in for a streamed `requests.Response` object.
+
+    Parameters
+    ----------
+    chunks : list
+        List of byte strings returned by `iter_content`
+    fail : bool
+        If True, raise a ChunkedEncodingError after the chunks are returned
+        (default=False)
+
+    """
+
+    def __init__(self, chunks, fail=False):
+        self.chunks = chunks
+        self.fail = fail
+        return
+
+    def iter_content(self, chunk_size=1):
+        """Iterate over the response content, as done by requests."""
+
+        for chunk in self.chunks:
+            yield chunk
+
+        if self.fail:
+            raise requests.exceptions.ChunkedEncodingError('Connection lost')
+        return
+
+
 class TestCDAWeb(object):
     """Unit tests for `pysat.instrument.methods.cdaweb`."""
 
@@ -101,17 +130,18 @@ class TestCDAWeb(object):
     def test_bad_zip_warning_get_files(self, caplog):
         """Test that warning is raised for unsupported zip method."""
 
-        # Specifiy small file to get
-        url = 'https://cdaweb.gsfc.nasa.gov/pub/000_readme.txt'
-        req = requests.get(url)
+        # Only the zip method is tested, so the file content is not retrieved
+        # from a remote server
+        remote_file = b'Test file content'
 
         # Download to temporary location
         temp_dir = tempfile.TemporaryDirectory()
 
         with caplog.at_level(logging.WARNING, logger='pysat'):
-            cdw._get_file(req.content, '.', 'test.txt', temp_path=temp_dir.name,
+            cdw._get_file(remote_file, '.', 'test.txt', temp_path=temp_dir.name,
                           zip_method='badzip')
         captured = caplog.text
+        temp_dir.cleanup()
 
         # Check for appropriate warning
         warn_msg = "not a recognized zip method"
@@ -119,6 +149,37 @@ class TestCDAWeb(object):
 
         return
 
+    def test_get_file_streamed(self):
+        """Test that streamed content is written to the destination file."""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        remote_file = StreamedResponse([b'Test file ', b'content'])
+        cdw._get_file(remote_file, temp_dir.name, 'test.txt')
+
+        with open(os.path.join(temp_dir.name, 'test.txt'), 'rb') as fin:
+            content = fin.read()
+        files = os.listdir(temp_dir.name)
+        temp_dir.cleanup()
+
+        assert content == b'Test file content'
+        assert files == ['test.txt']
+        return
+
+    def test_get_file_interrupted_stream(self):
+        """Test that an interrupted stream does not leave a partial file."""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        remote_file = StreamedResponse([b'Test file '], fail=True)
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            cdw._get_file(remote_file, temp_dir.name, 'test.txt')
+
+        files = os.listdir(temp_dir.name)
+        temp_dir.cleanup()
+
+        assert len(files) == 0, "Unexpected files left: {:}".format(files)
+        return
+
     def test_get_file_unzip_without_temp_path(self):
         """Test that warning when cdf file does not have expected params."""
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.3986131
+#
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Unit tests for the cdflib CDF wrapper methods."""
+
+import datetime as dt
+import logging
+import numpy as np
+
+import pytest
+
+from pysatNASA.instruments.methods import _cdf
+
+
+class StubCDFFile(object):
+    """Stand-in for a `cdflib.CDF` file with an epoch and delta variables.
+
+    Parameters
+    ----------
+    delta_plus : float or array-like
+        Values for the DELTA_PLUS_VAR variable, in seconds
+    delta_minus : float or array-like
+        Values for the DELTA_MINUS_VAR variable, in seconds
+
+    """
+
+    def __init__(self, delta_plus, delta_minus):
+        self.variables = {'Epoch': np.array([0.0, 1.0]),
+                          'Epoch_plus': np.asarray(delta_plus),
+                          'Epoch_minus': np.asarray(delta_minus)}
+        return
+
+    def varinq(self, name):
+        """Return the variable information, using the cdflib < 1.0 format."""
+
+        return {'Data_Type_Description': 'CDF_EPOCH'}
+
+    def varget(self, name):
+        """Return the variable data."""
+
+        return self.variables[name]
+
+    def varattsget(self, name):
+        """Return the variable attributes."""
+
+        if name == 'Epoch':
+            return {'DELTA_PLUS_VAR': 'Epoch_plus',
+                    'DELTA_MINUS_VAR': 'Epoch_minus'}
+        return {}
+
+
+class TestCDF(object):
+    """Unit tests for `pysatNASA.instruments.methods._cdf.CDF`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+
+        # Create the CDF object without opening a file
+        self.cdf = _cdf.CDF.__new__(_cdf.CDF)
+        self.cdf._filename = 'stub.cdf'
+        self.cdf._datetime = True
+        self.cdf._center_measurement = True
+        self.cdf._dependencies = {}
+        self.times = [dt.datetime(2009, 1, 1), dt.datetime(2009, 1, 1, 0, 1)]
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+
+        del self.cdf, self.times
+        return
+
+    @pytest.mark.parametrize("delta_plus,delta_minus,offsets",
+                             [(4.0, 0.0, [2.0, 2.0]),
+                              ([1.0, 3.0], [0.0, 0.0], [0.5, 1.5])])
+    def test_set_epoch_with_deltas(self, monkeypatch, delta_plus,
+                                   delta_minus, offsets):
+        """Test that centered epochs are offset by the measurement deltas.
+
+        Parameters
+        ----------
+        delta_plus : float or list
+            Values for the DELTA_PLUS_VAR variable, in seconds
+        delta_minus : float or list
+            Values for the DELTA_MINUS_VAR variable, in seconds
+        offsets : list
+            Expected offset from the epoch times, in seconds
+
+        """
+
+        monkeypatch.setattr(_cdf.cdflib.cdfepoch, 'to_datetime',
+                            lambda xdata: self.times)
+        self.cdf._cdf_file = StubCDFFile(delta_plus, delta_minus)
+        self.cdf.set_epoch('Epoch')
+
+        comp = [np.datetime64(tval + dt.timedelta(seconds=offsets[i]), 'ns')
+                for i, tval in enumerate(self.times)]
+        assert list(self.cdf.get_dependency('Epoch')) == comp
+        return
+
+    @pytest.mark.parametrize("delta_plus,delta_minus",
+                             [(4.0, 0.0), ([1.0, 3.0], [0.0, 0.0])])
+    def test_set_epoch_invalid_epoch_with_deltas(self, caplog, monkeypatch,
+                                                 delta_plus, delta_minus):
+        """Test that an invalid epoch warns and yields no times.
+
+        Parameters
+        ----------
+        delta_plus : float or list
+            Values for the DELTA_PLUS_VAR variable, in seconds
+        delta_minus : float or list
+            Values for the DELTA_MINUS_VAR variable, in seconds
+
+        """
+
+        def bad_to_datetime(xdata):
+            raise TypeError('bad epoch')
+
+        monkeypatch.setattr(_cdf.cdflib.cdfepoch, 'to_datetime',
+                            bad_to_datetime)
+        self.cdf._cdf_file = StubCDFFile(delta_plus, delta_minus)
+
+        with caplog.at_level(logging.WARNING, logger='pysat'):
+            self.cdf.set_epoch('Epoch')
+
+        assert "Invalid data file(s)" in caplog.text
+        assert len(self.cdf.get_dependency('Epoch')) == 0
+        return
@@ -11,7 +11,6 @@
 
 import datetime as dt
 import numpy as np
-import pandas as pds
 
 import pytest
 
@@ -48,33 +47,32 @@ class TestJHUAPL(object):
 
         # Create the common string for this time using `var`
         self.test_inst['YEAR{:s}'.format(self.var_list[0])] = np.full(
-            shape=self.test_inst['time'].shape, fill_value=self.test_inst.yr)
+            shape=self.test_inst['time'].shape, fill_value=self.test_inst.yr,
+            dtype=np.int16)
         self.test_inst['DOY{:s}'.format(self.var_list[0])] = np.full(
-            shape=self.test_inst['time'].shape, fill_value=self.test_inst.doy)
+            shape=self.test_inst['time'].shape, fill_value=self.test_inst.doy,
+            dtype=np.int16)
         self.test_inst['TIME{:s}'.format(self.var_list[0])] = self.test_inst[
             'uts']
-        self.test_inst['EPOCH'] = [self.epoch_date + dt.timedelta(seconds=sec)
-                                   for sec in self.test_inst['uts'].values]
-
-        # Add DQI masks for the multi-dim data variables
-        self.test_inst['DQI_Z'] = (('time', 'z'), np.zeros(shape=(
-            self.test_inst.data.sizes['time'], self.test_inst.data.sizes['z'])))
-        self.test_inst['DQI_X'] = (('time', 'x'), np.zeros(shape=(
-            self.test_inst.data.sizes['time'], self.test_inst.data.sizes['x'])))
-
-        # Set some bad values for the DQI data
-        self.test_inst['DQI_Z'][:, 0] = 3
-        self.test_inst['DQI_Z'][:, 1] = 2
-        self.test_inst['DQI_Z'][:, 2] = 1
-        self.test_inst['DQI_X'][:, 0] = 3
-        self.test_inst['DQI_X'][:, 1] = 2
-        self.test_inst['DQI_X'][:, 2] = 1
+        self.test_inst['EPOCH'] = np.datetime64(self.epoch_date, 'ns') + (
+            self.test_inst['uts'].values * 1.0e6).round().astype(
+                'timedelta64[us]')
+
+        # Add DQI masks for the multi-dim data variables, setting some bad
+        # values for the DQI data
+        for dim in ['z', 'x']:
+            dqi = np.zeros(shape=(self.test_inst.data.sizes['time'],
+                                  self.test_inst.data.sizes[dim]),
+                           dtype=np.int8)
+            dqi[:, :3] = [3, 2, 1]
+            self.test_inst['DQI_{:s}'.format(dim.upper())] = (('time', dim),
+                                                              dqi)
 
         return
 
     @pytest.mark.parametrize("epoch_var", ['time', 'EPOCH'])
     def test_build_dtimes(self, epoch_var):
-        """Test creation of datetime list from JHU APL times.
+        """Test creation of datetime array from JHU APL times.
 
         Parameters
         ----------
@@ -92,11 +90,10 @@ class TestJHUAPL(object):
                                        epoch=epoch, epoch_var=epoch_var)
 
         # Get the comparison from the Instrument index
-        self.comp = [pds.to_datetime(tval).to_pydatetime()
-                     for tval in self.test_inst.index]
+        self.comp = list(self.test_inst.index.values)
 
         # Ensure the lists are equal
-        pysat.utils.testing.assert_lists_equal(self.out, self.comp)
+        pysat.utils.testing.assert_lists_equal(list(self.out), self.comp)
         return
 
     @pytest.mark.parametrize("clean_level", ['clean', 'dusty', 'dirty', 'none'])
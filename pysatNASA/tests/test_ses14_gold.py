@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.3986131
+#
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Unit tests for the SES14 GOLD load support functions."""
+
+import numpy as np
+import xarray as xr
+
+import pytest
+
+from pysatNASA.instruments import ses14_gold
+
+
+class TestGOLDCoords(object):
+    """Unit tests for updating the coordinates of loaded GOLD data."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+
+        self.ntime = 3
+        self.channel = np.array([b'CHA', b'CHB', b'CHA'])
+        self.data = None
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+
+        del self.ntime, self.channel, self.data
+        return
+
+    def set_disk_data(self):
+        """Create a synthetic nmax, tlimb, or tdisk Dataset."""
+
+        self.data = xr.Dataset(
+            {'channel': (('time',), self.channel),
+             'hemisphere': (('time',), np.array([b'N', b'S', b'N'])),
+             'latitude': (('time', 'nlats', 'nlons'),
+                          np.zeros(shape=(self.ntime, 4, 5))),
+             'mask': (('time', 'nmask'), np.zeros(shape=(self.ntime, 2)))},
+            coords={'time': np.arange(self.ntime)})
+        return
+
+    def set_o2den_data(self):
+        """Create a synthetic o2den Dataset with swapped altitude dimensions."""
+
+        self.data = xr.Dataset(
+            {'channel': (('time',), self.channel),
+             'o2den': (('time', 'zret'), np.zeros(shape=(self.ntime, 4))),
+             'radiance': (('time', 'zdat', 'n_wavelength'),
+                          np.zeros(shape=(self.ntime, 5, 2)))},
+            coords={'time': np.arange(self.ntime),
+                    'zret': np.linspace(100.0, 250.0, 4),
+                    'zdat': np.linspace(100.0, 300.0, 5)})
+        return
+
+    @pytest.mark.parametrize("tag,index_dims,coord_vars",
+                             [('nmax', ['nlats', 'nlons', 'nmask'],
+                               ['channel', 'hemisphere']),
+                              ('o2den', ['n_wavelength'],
+                               ['zret', 'zdat', 'channel'])])
+    def test_update_coords(self, tag, index_dims, coord_vars):
+        """Test that index dimensions and variables become coordinates.
+
+        Parameters
+        ----------
+        tag : str
+            GOLD tag whose data layout is tested
+        index_dims : list
+            Dimensions without a data variable
+        coord_vars : list
+            Data variables to set as coordinates
+
+        """
+        if tag == 'o2den':
+            self.set_o2den_data()
+        else:
+            self.set_disk_data()
+
+        # Ensure the index dimensions have no variable before the update
+        for dim in index_dims:
+            assert dim not in self.data.variables
+
+        self.data = ses14_gold._update_coords(self.data, index_dims,
+                                              coord_vars)
+
+        # Index dimensions should have their default integer index
+        for dim in index_dims:
+            assert dim in self.data.coords, "{:} not a coordinate".format(dim)
+            assert np.all(self.data[dim].values
+                          == np.arange(self.data.sizes[dim]))
+
+        # Variables should be coordinates, with their values unchanged
+        for var in coord_vars:
+            assert var in self.data.coords, "{:} not a coordinate".format(var)
+            assert var not in self.data.data_vars
+
+        assert np.all(self.data['channel'].values == self.channel)
+        return